@@ -1,22 +1,168 @@
 # Automated Test Suite Generator
 # A comprehensive testing framework for web applications with form validation and reporting
 
+import csv
+import html
 import json
+import re
 import time
 import os
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import pandas as pd
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import logging
+import logging.handlers
+import atexit
 import argparse
 
+try:
+    import requests
+except ImportError:  # Browser-free HTTP checks are optional
+    requests = None
+
+try:
+    import lxml.html
+except ImportError:  # Static form checks are optional
+    lxml = None
+
+# Root logger is configured once per process, however many executors are created
+_logging_configured = False
+_log_buffer = None
+
+# Persistent Chrome profile slots claimed in this process, shared by all executors
+_profile_slots = set()
+_profile_lock = threading.Lock()
+
+# Verification types that only need the final URL and <title> of a page
+HTTP_TYPES = ('url_contains', 'title_contains')
+
+TITLE_RE = re.compile(r'<title[^>]*>([^<]*)</title>', re.I)
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+
+# Actions that can change the DOM, invalidating cached element state and page reuse
+MUTATING_ACTIONS = ('input', 'input_batch', 'click', 'clear_field', 'script')
+
+# Verification types that can be answered from a cached element snapshot
+SNAPSHOT_TYPES = ('element_visible', 'element_not_visible', 'text_contains')
+
+# Visibility predicate shared by the scripts below
+IS_VISIBLE_JS = """
+function isVisible(el) {
+    return !!el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+}
+"""
+
+# Fetches computed visibility and text for a list of selectors in one call
+SNAPSHOT_SCRIPT = IS_VISIBLE_JS + """
+return arguments[0].map(function (selector) {
+    var el = document.querySelector(selector);
+    if (!el) { return null; }
+    return {visible: isVisible(el), text: el.innerText};
+});
+"""
+
+# Returns whether each selector in a list matches a visible element
+VISIBLE_ALL_SCRIPT = IS_VISIBLE_JS + """
+return arguments[0].map(function (selector) {
+    return isVisible(document.querySelector(selector));
+});
+"""
+
+# Invalid input used by the data type validation tests, keyed by field type
+INVALID_VALUES = {
+    'email': 'invalid-email',
+    'phone': '123',
+}
+
+# Native HTML attributes that enforce each kind of validation test
+STATIC_CONSTRAINTS = {
+    'required': lambda el: el.get('required') is not None,
+    'email': lambda el: (el.get('type') or '').lower() == 'email',
+    'phone': lambda el: el.get('pattern') is not None,
+}
+
+# Waits for the field and submit button, clears the field, submits the form and resolves
+# with {ok, reason} saying whether the error element became visible; each phase polls
+# for up to timeout_ms. args: [field, submit, error, timeout_ms]
+REQUIRED_FIELD_SCRIPT = IS_VISIBLE_JS + """
+var done = arguments[arguments.length - 1];
+var args = arguments[0];
+var deadline = Date.now() + args[3];
+function retry(step, reason) {
+    if (Date.now() >= deadline) {
+        done({ok: false, reason: reason});
+    } else {
+        setTimeout(step, 50);
+    }
+}
+(function submit() {
+    var field = document.querySelector(args[0]);
+    var button = document.querySelector(args[1]);
+    if (!field) {
+        return retry(submit, 'field ' + args[0] + ' not found');
+    }
+    if (!button) {
+        return retry(submit, 'submit button ' + args[1] + ' not found');
+    }
+    if (!isVisible(button) || button.disabled) {
+        return retry(submit, 'submit button ' + args[1] + ' not clickable');
+    }
+    field.value = '';
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+    button.click();
+    deadline = Date.now() + args[3];
+    (function check() {
+        if (isVisible(document.querySelector(args[2]))) {
+            done({ok: true});
+        } else {
+            retry(check, 'error element ' + args[2] + ' not visible');
+        }
+    })();
+})();
+"""
+
+# One row of the HTML report table; fields are escaped before formatting
+ROW_TEMPLATE = """
+                    <tr class="status-{c}">
+                        <td>{n}</td>
+                        <td>{s}</td>
+                        <td>{t:.2f}</td>
+                        <td>{e}</td>
+                        <td>{ts}</td>
+                    </tr>
+            """
+
+# Resolves a selector through a per-page cache so the browser parses it once per load;
+# detached nodes (e.g. after a re-render) are looked up again
+SELECTOR_CACHE_SCRIPT = """
+var cache = window.__sel_cache || (window.__sel_cache = {});
+var el = cache[arguments[0]];
+if (!el || !el.isConnected) {
+    el = cache[arguments[0]] = document.querySelector(arguments[0]);
+}
+return el;
+"""
+
+# Sets a list of {s: selector, v: value} fields and fires input/change events
+INPUT_BATCH_SCRIPT = """
+arguments[0].forEach(function (field) {
+    var el = document.querySelector(field.s);
+    el.value = field.v;
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+"""
+
 @dataclass
 class TestCase:
     """Represents a single test case"""
@@ -44,67 +190,55 @@ class TestCaseGenerator:
     @staticmethod
     def generate_form_validation_tests(form_config: Dict) -> List[TestCase]:
         """Generate comprehensive form validation test cases"""
-        tests = []
+        url = form_config['url']
+        submit = {"action": "click", "selector": form_config['submit_button']}
         
-        # Required field validation
-        for field in form_config.get('required_fields', []):
-            tests.append(TestCase(
-                name=f"test_required_field_{field['name']}",
-                url=form_config['url'],
-                actions=[
-                    {"action": "clear_field", "selector": field['selector']},
-                    {"action": "click", "selector": form_config['submit_button']},
-                ],
-                expected_results=[
-                    {"type": "element_visible", "selector": field.get('error_selector', f"#{field['name']}-error")}
-                ],
-                test_type="validation",
-                tags=["form", "validation", "required"]
-            ))
+        # Required field validation, fused into a single browser round-trip
+        tests = [TestCase(
+            name=f"test_required_field_{field['name']}",
+            url=url,
+            actions=[
+                {"action": "script", "code": REQUIRED_FIELD_SCRIPT, "args": [
+                    field['selector'],
+                    form_config['submit_button'],
+                    field.get('error_selector', f"#{field['name']}-error"),
+                    5000
+                ]},
+            ],
+            expected_results=[
+                {"type": "script_returns_true"}
+            ],
+            test_type="validation",
+            tags=["form", "validation", "required"]
+        ) for field in form_config.get('required_fields', [])]
         
         # Data type validation
-        for field in form_config.get('validation_fields', []):
-            if field['type'] == 'email':
-                tests.append(TestCase(
-                    name=f"test_email_validation_{field['name']}",
-                    url=form_config['url'],
-                    actions=[
-                        {"action": "input", "selector": field['selector'], "value": "invalid-email"},
-                        {"action": "click", "selector": form_config['submit_button']},
-                    ],
-                    expected_results=[
-                        {"type": "element_visible", "selector": field.get('error_selector', f"#{field['name']}-error")}
-                    ],
-                    test_type="validation",
-                    tags=["form", "validation", "email"]
-                ))
-            
-            elif field['type'] == 'phone':
-                tests.append(TestCase(
-                    name=f"test_phone_validation_{field['name']}",
-                    url=form_config['url'],
-                    actions=[
-                        {"action": "input", "selector": field['selector'], "value": "123"},
-                        {"action": "click", "selector": form_config['submit_button']},
-                    ],
-                    expected_results=[
-                        {"type": "element_visible", "selector": field.get('error_selector', f"#{field['name']}-error")}
-                    ],
-                    test_type="validation",
-                    tags=["form", "validation", "phone"]
-                ))
+        tests.extend([TestCase(
+            name=f"test_{field['type']}_validation_{field['name']}",
+            url=url,
+            actions=[
+                {"action": "input", "selector": field['selector'], "value": INVALID_VALUES[field['type']]},
+                submit,
+            ],
+            expected_results=[
+                {"type": "element_visible", "selector": field.get('error_selector', f"#{field['name']}-error")}
+            ],
+            test_type="validation",
+            tags=["form", "validation", field['type']]
+        ) for field in form_config.get('validation_fields', []) if field['type'] in INVALID_VALUES])
         
         # Successful form submission
-        valid_data = {field['name']: field.get('valid_value', 'test') 
-                     for field in form_config.get('all_fields', [])}
-        
-        actions = [{"action": "input", "selector": field['selector'], "value": valid_data[field['name']]} 
-                  for field in form_config.get('all_fields', [])]
-        actions.append({"action": "click", "selector": form_config['submit_button']})
+        actions = [
+            {"action": "input_batch", "fields": [
+                {"selector": field['selector'], "value": field.get('valid_value', 'test')}
+                for field in form_config.get('all_fields', [])
+            ]},
+            submit,
+        ]
         
         tests.append(TestCase(
             name="test_successful_form_submission",
-            url=form_config['url'],
+            url=url,
             actions=actions,
             expected_results=[
                 {"type": "url_contains", "value": form_config.get('success_url', '/success')}
@@ -115,6 +249,51 @@ class TestCaseGenerator:
         
         return tests
     
+    @staticmethod
+    def quick_static_form_check(url: str, test_cases: List[TestCase], timeout: int = 10) -> List[Optional[TestResult]]:
+        """Resolve validation tests from a page's static HTML; None marks tests still needing Selenium"""
+        if requests is None or lxml is None:
+            return [None] * len(test_cases)
+        
+        start_time = time.time()
+        try:
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
+            tree = lxml.html.fromstring(response.content)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Static form check failed for {url}: {str(e)}")
+            return [None] * len(test_cases)
+        
+        results = []
+        for test_case in test_cases:
+            kind = next((tag for tag in (test_case.tags or []) if tag in STATIC_CONSTRAINTS), None)
+            action = test_case.actions[0] if test_case.actions else {}
+            # Script actions take the target field as their first argument
+            selector = action.get('selector') or (action.get('args') or [None])[0]
+            try:
+                elements = tree.cssselect(selector) if kind and selector else []
+            except Exception as e:
+                # cssselect missing or unable to translate the selector (e.g. :has(), :invalid)
+                logging.getLogger(__name__).warning(f"Static check skipped for {selector}: {str(e)}")
+                elements = []
+            if not elements:
+                # Field is rendered by JavaScript or the test is not a simple field check
+                results.append(None)
+                continue
+            
+            result = TestResult(
+                test_name=test_case.name,
+                status="PASS",
+                execution_time=time.time() - start_time,
+                timestamp=datetime.now().isoformat()
+            )
+            if not STATIC_CONSTRAINTS[kind](elements[0]):
+                result.status = "FAIL"
+                result.error_message = f"Field {selector} has no native {kind} constraint"
+            results.append(result)
+        
+        return results
+    
     @staticmethod
     def generate_regression_tests(pages_config: List[Dict]) -> List[TestCase]:
         """Generate regression test cases for multiple pages"""
@@ -125,7 +304,7 @@ class TestCaseGenerator:
             tests.append(TestCase(
                 name=f"test_page_load_{page['name']}",
                 url=page['url'],
-                actions=[{"action": "wait", "time": 2}],
+                actions=[{"action": "wait", "until": "document_ready"}],
                 expected_results=[
                     {"type": "title_contains", "value": page.get('expected_title', page['name'])}
                 ],
@@ -138,11 +317,10 @@ class TestCaseGenerator:
                 tests.append(TestCase(
                     name=f"test_critical_elements_{page['name']}",
                     url=page['url'],
-                    actions=[{"action": "wait", "time": 1}],
+                    actions=[{"action": "wait", "until": "document_ready"}],
                     expected_results=[
-                        {"type": "element_visible", "selector": selector} 
-                        for selector in page['critical_elements']
-                    ],
+                        {"type": "element_visible_all", "selectors": page['critical_elements']}
+                    ] if page['critical_elements'] else [],
                     test_type="regression",
                     tags=["elements", "regression"]
                 ))
@@ -152,27 +330,82 @@ class TestCaseGenerator:
 class TestExecutor:
     """Executes test cases using Selenium WebDriver"""
     
-    def __init__(self, headless: bool = True, timeout: int = 10):
+    def __init__(self, headless: bool = True, timeout: int = 10, max_workers: Optional[int] = None,
+                 static_validation: bool = False, http_checks: bool = True,
+                 keep_browsers: bool = False, fast_mode: bool = True,
+                 profile_dir: Optional[str] = os.path.expanduser("~/.at_suite_chrome")):
         self.timeout = timeout
-        self.driver = None
         self.headless = headless
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.static_validation = static_validation
+        self.http_checks = http_checks
+        self.keep_browsers = keep_browsers
+        self.fast_mode = fast_mode
+        self.profile_dir = profile_dir
         self.results = []
+        self._local = threading.local()
+        self._drivers = {}  # driver -> claimed profile slot (None for a throwaway profile)
+        self._pool = None
+        self._generation = 0
+        self._screenshot_pool = ThreadPoolExecutor(max_workers=1)
+        self._screenshot_futures = {}  # screenshot path -> pending write
+        self._lock = threading.Lock()
         self.setup_logging()
     
+    @property
+    def driver(self):
+        """WebDriver owned by the current worker thread"""
+        return getattr(self._local, 'driver', None)
+    
+    @driver.setter
+    def driver(self, value):
+        self._local.driver = value
+    
+    @property
+    def _wait(self):
+        """WebDriverWait bound to this thread's WebDriver, reused across actions"""
+        wait = getattr(self._local, 'wait', None)
+        if wait is None:
+            wait = self._local.wait = WebDriverWait(self.driver, self.timeout)
+        return wait
+    
+    @property
+    def _last_url(self):
+        """URL of the page currently loaded in this thread's WebDriver"""
+        return getattr(self._local, 'last_url', None)
+    
+    @_last_url.setter
+    def _last_url(self, value):
+        self._local.last_url = value
+    
     def setup_logging(self):
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('test_execution.log'),
-                logging.StreamHandler()
-            ]
-        )
+        global _logging_configured, _log_buffer
+        if not _logging_configured:
+            log_format = '%(asctime)s - %(levelname)s - %(message)s'
+            # The buffer only forwards records, so the file handler needs its own formatter
+            file_handler = logging.FileHandler('test_execution.log')
+            file_handler.setFormatter(logging.Formatter(log_format))
+            # Buffer file writes; errors and a full buffer trigger a flush
+            _log_buffer = logging.handlers.MemoryHandler(
+                capacity=1024,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            atexit.register(_log_buffer.flush)
+            logging.basicConfig(
+                level=logging.INFO,
+                format=log_format,
+                handlers=[
+                    _log_buffer,
+                    logging.StreamHandler()
+                ]
+            )
+            _logging_configured = True
         self.logger = logging.getLogger(__name__)
     
-    def setup_driver(self):
-        """Initialize WebDriver with appropriate options"""
+    def _chrome_options(self, user_data_dir: Optional[str] = None) -> Options:
+        """Build Chrome options, optionally pointing at a persistent profile directory"""
         options = Options()
         if self.headless:
             options.add_argument('--headless')
@@ -180,55 +413,244 @@ class TestExecutor:
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--window-size=1920,1080')
         
-        self.driver = webdriver.Chrome(options=options)
+        if self.fast_mode:
+            # Checks only need DOM/URL/title: skip images and return on DOMContentLoaded
+            prefs = {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.cookies": 1
+            }
+            options.add_experimental_option("prefs", prefs)
+            options.page_load_strategy = 'eager'
+        
+        if user_data_dir:
+            options.add_argument(f'--user-data-dir={user_data_dir}')
+            options.add_argument('--profile-directory=Default')
+        return options
+    
+    def setup_driver(self):
+        """Initialize WebDriver with appropriate options"""
+        driver = slot = None
+        if self.profile_dir:
+            # Persist HTTP/disk cache across runs; Chrome locks a profile, so each browser gets its own slot
+            with _profile_lock:
+                slot = next(i for i in itertools.count() if i not in _profile_slots)
+                _profile_slots.add(slot)
+            try:
+                driver = webdriver.Chrome(options=self._chrome_options(
+                    os.path.join(self.profile_dir, f"worker-{slot}")
+                ))
+            except Exception as e:
+                # Most likely another process (CLI run, web UI) holds this profile
+                self.logger.warning(f"Persistent profile worker-{slot} unavailable, using a temporary one: {str(e)}")
+                with _profile_lock:
+                    _profile_slots.discard(slot)
+                slot = None
+        if driver is None:
+            driver = webdriver.Chrome(options=self._chrome_options())
+        
+        self.driver = driver
         self.driver.implicitly_wait(self.timeout)
+        self._local.wait = WebDriverWait(self.driver, self.timeout)
+        self._last_url = None
+        self._invalidate_snapshot()
+        with self._lock:
+            self._drivers[self.driver] = slot
         return self.driver
     
+    def ensure_driver(self):
+        """Replace this thread's WebDriver if it is missing or its browser has died"""
+        # A browser kept from an earlier suite may have crashed or timed out while idle
+        if (self.driver is not None and getattr(self._local, 'generation', None) != self._generation
+                and not self._driver_alive()):
+            self._local.driver_dead = True
+        if self.driver is not None and not getattr(self._local, 'driver_dead', False):
+            return self.driver
+        driver, self.driver = self.driver, None
+        if driver is not None:
+            self.logger.warning("Browser session lost, starting a new one")
+            with self._lock:
+                slot = self._drivers.pop(driver, None)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            with _profile_lock:
+                _profile_slots.discard(slot)
+        self._local.driver_dead = False
+        return self.setup_driver()
+    
+    def _driver_alive(self) -> bool:
+        """Probe whether this thread's browser session still responds"""
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def quit_drivers(self):
+        """Quit every WebDriver started by the worker threads"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, {}
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.error(f"Driver quit failed: {str(e)}")
+        # Slots are freed only once their browsers have released the profile lock
+        with _profile_lock:
+            _profile_slots.difference_update(drivers.values())
+    
+    def _invalidate_snapshot(self):
+        """Drop cached element state once the DOM may have changed"""
+        self._local.navigation_counter = getattr(self._local, 'navigation_counter', 0) + 1
+        self._local.snapshot_cache = {}
+    
+    def _snapshot_key(self):
+        """Cache key identifying the current page state in this thread"""
+        return (getattr(self._local, 'page_url', None), getattr(self._local, 'navigation_counter', 0))
+    
+    def take_snapshot(self, selectors: List[str]):
+        """Fetch visibility and text for several selectors in one round-trip"""
+        # A single selector gains nothing from the extra call; verify_result queries it directly
+        if len(selectors) < 2:
+            return
+        try:
+            states = self.driver.execute_script(SNAPSHOT_SCRIPT, selectors)
+        except Exception as e:
+            self.logger.error(f"Snapshot failed: {str(e)}")
+            return
+        self._local.snapshot_cache = {self._snapshot_key(): dict(zip(selectors, states))}
+    
+    def _cached_element(self, selector: str):
+        """Return (hit, state) for a selector from the current snapshot"""
+        snapshot = getattr(self._local, 'snapshot_cache', {}).get(self._snapshot_key())
+        if snapshot is None or selector not in snapshot:
+            return False, None
+        return True, snapshot[selector]
+    
+    def find_cached(self, selector: str, clickable: bool = False):
+        """Locate an element through the in-page selector cache, waiting until it exists (and is clickable)"""
+        def located(driver):
+            element = driver.execute_script(SELECTOR_CACHE_SCRIPT, selector)
+            if not element or not clickable:
+                return element
+            try:
+                return element if element.is_displayed() and element.is_enabled() else False
+            except StaleElementReferenceException:
+                # Re-rendered while checking; the next poll looks the element up again
+                return False
+        return self._wait.until(located)
+    
+    @staticmethod
+    def describe_action(action: Dict[str, Any]) -> Dict[str, Any]:
+        """Action as shown in logs and reports, without inline script source"""
+        return {key: value for key, value in action.items() if key != 'code'}
+    
+    def describe_failure(self, expected: Dict[str, Any]):
+        """Expected result as shown in reports, with the reason a script gave for failing"""
+        script_result = getattr(self._local, 'script_result', None)
+        if (expected['type'] == 'script_returns_true' and isinstance(script_result, dict)
+                and script_result.get('reason')):
+            return script_result['reason']
+        return expected
+    
     def execute_action(self, action: Dict[str, Any]) -> bool:
         """Execute a single test action"""
         try:
+            if action['action'] in MUTATING_ACTIONS:
+                self._invalidate_snapshot()
+            
             if action['action'] == 'input':
-                element = WebDriverWait(self.driver, self.timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, action['selector']))
-                )
+                element = self.find_cached(action['selector'])
                 element.clear()
                 element.send_keys(action['value'])
                 
+            elif action['action'] == 'input_batch':
+                fields = [{"s": field['selector'], "v": field['value']} for field in action['fields']]
+                try:
+                    self.driver.execute_script(INPUT_BATCH_SCRIPT, fields)
+                except Exception as e:
+                    # Fall back to typing each field through WebDriver
+                    self.logger.warning(f"Batch input failed, using per-field input: {str(e)}")
+                    return all(self.execute_action({"action": "input", **field}) for field in action['fields'])
+                
             elif action['action'] == 'click':
-                element = WebDriverWait(self.driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, action['selector']))
-                )
+                element = self.find_cached(action['selector'], clickable=True)
                 element.click()
                 
             elif action['action'] == 'clear_field':
-                element = self.driver.find_element(By.CSS_SELECTOR, action['selector'])
+                element = self.find_cached(action['selector'])
                 element.clear()
                 
+            elif action['action'] == 'script':
+                # Result is kept for a following script_returns_true verification
+                self._local.script_result = self.driver.execute_async_script(action['code'], action.get('args', []))
+                
             elif action['action'] == 'wait':
-                time.sleep(action.get('time', 1))
+                until = action.get('until')
+                timeout = action.get('timeout', self.timeout)
+                if until == 'element_visible':
+                    WebDriverWait(self.driver, timeout).until(
+                        EC.visibility_of_element_located((By.CSS_SELECTOR, action['selector']))
+                    )
+                elif until == 'document_ready':
+                    WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                        lambda driver: driver.execute_script("return document.readyState") == "complete"
+                    )
+                elif until is None:
+                    # Legacy fixed waits are capped; prefer an "until" condition
+                    time.sleep(min(action.get('time', 1), 0.2))
+                else:
+                    self.logger.error(f"Unknown wait condition: {until}")
+                    return False
                 
             return True
             
         except Exception as e:
-            self.logger.error(f"Action failed: {action} - {str(e)}")
+            self.logger.error(f"Action failed: {self.describe_action(action)} - {str(e)}")
             return False
     
     def verify_result(self, expected: Dict[str, Any]) -> bool:
         """Verify expected test result"""
         try:
             if expected['type'] == 'element_visible':
+                hit, state = self._cached_element(expected['selector'])
+                if hit and state and state['visible']:
+                    return True
                 WebDriverWait(self.driver, 5).until(
                     EC.visibility_of_element_located((By.CSS_SELECTOR, expected['selector']))
                 )
                 return True
                 
+            elif expected['type'] == 'element_visible_all':
+                # One script call per poll checks every selector at once
+                try:
+                    WebDriverWait(self.driver, 5, poll_frequency=0.05).until(
+                        lambda driver: all(driver.execute_script(VISIBLE_ALL_SCRIPT, expected['selectors']))
+                    )
+                except TimeoutException:
+                    visible = self.driver.execute_script(VISIBLE_ALL_SCRIPT, expected['selectors'])
+                    missing = [selector for selector, ok in zip(expected['selectors'], visible) if not ok]
+                    self.logger.error(f"Elements not visible: {missing}")
+                    return False
+                return True
+                
             elif expected['type'] == 'element_not_visible':
+                hit, state = self._cached_element(expected['selector'])
+                if hit:
+                    return not (state and state['visible'])
                 try:
                     element = self.driver.find_element(By.CSS_SELECTOR, expected['selector'])
                     return not element.is_displayed()
                 except NoSuchElementException:
                     return True
                     
+            elif expected['type'] == 'script_returns_true':
+                script_result = getattr(self._local, 'script_result', None)
+                if isinstance(script_result, dict):
+                    return script_result.get('ok') is True
+                return script_result is True
+                
             elif expected['type'] == 'url_contains':
                 return expected['value'] in self.driver.current_url
                 
@@ -236,6 +658,9 @@ class TestExecutor:
                 return expected['value'].lower() in self.driver.title.lower()
                 
             elif expected['type'] == 'text_contains':
+                hit, state = self._cached_element(expected['selector'])
+                if hit and state:
+                    return expected['value'] in state['text']
                 element = self.driver.find_element(By.CSS_SELECTOR, expected['selector'])
                 return expected['value'] in element.text
                 
@@ -245,50 +670,93 @@ class TestExecutor:
             self.logger.error(f"Verification failed: {expected} - {str(e)}")
             return False
     
-    def take_screenshot(self, test_name: str) -> str:
+    def take_screenshot(self, test_name: str, now: Optional[datetime] = None) -> str:
         """Take screenshot for failed test"""
         try:
             screenshots_dir = "screenshots"
             os.makedirs(screenshots_dir, exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
             filename = f"{test_name}_{timestamp}.png"
             filepath = os.path.join(screenshots_dir, filename)
             
-            self.driver.save_screenshot(filepath)
+            # Capture synchronously (WebDriver is not thread-safe) but write to disk in the background
+            png = self.driver.get_screenshot_as_png()
+            future = self._screenshot_pool.submit(self._write_screenshot, filepath, png)
+            with self._lock:
+                self._screenshot_futures[filepath] = future
             return filepath
         except Exception as e:
             self.logger.error(f"Screenshot failed: {str(e)}")
             return ""
     
+    def _write_screenshot(self, filepath: str, png: bytes) -> bool:
+        """Write captured screenshot bytes to disk, returning whether it succeeded"""
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(png)
+            return True
+        except Exception as e:
+            self.logger.error(f"Screenshot write failed: {filepath} - {str(e)}")
+            return False
+    
+    def wait_for_screenshots(self, results: List[Optional[TestResult]]):
+        """Block until the screenshot writes for these results finish, clearing paths that failed"""
+        for result in results:
+            if result is None or not result.screenshot_path:
+                continue
+            with self._lock:
+                future = self._screenshot_futures.pop(result.screenshot_path, None)
+            if future is not None and not future.result():
+                result.screenshot_path = ""
+    
+    def navigate(self, url: str) -> str:
+        """Load a URL, reusing the current page if it is already loaded and untouched"""
+        # Pages loaded by an earlier suite (e.g. a previous web request) are never reused
+        if url != self._last_url or getattr(self._local, 'generation', None) != self._generation:
+            self._last_url = None
+            self.driver.get(url)
+            self._local.generation = self._generation
+        self._invalidate_snapshot()
+        self._local.page_url = self.driver.current_url
+        return self._local.page_url
+    
     def execute_test(self, test_case: TestCase) -> TestResult:
         """Execute a single test case"""
         start_time = time.time()
+        now = datetime.now()
         result = TestResult(
             test_name=test_case.name,
             status="FAIL",
             execution_time=0,
-            timestamp=datetime.now().isoformat()
+            timestamp=now.isoformat()
         )
+        loaded_url = None
+        self._local.script_result = None
         
         try:
-            self.logger.info(f"Executing test: {test_case.name}")
+            self.logger.debug(f"Executing test: {test_case.name}")
+            self.ensure_driver()
             
             # Navigate to URL
-            self.driver.get(test_case.url)
+            loaded_url = self.navigate(test_case.url)
             
             # Execute actions
             for action in test_case.actions:
                 if not self.execute_action(action):
-                    result.error_message = f"Action failed: {action}"
-                    result.screenshot_path = self.take_screenshot(test_case.name)
+                    result.error_message = f"Action failed: {self.describe_action(action)}"
+                    result.screenshot_path = self.take_screenshot(test_case.name, now)
                     return result
             
+            # Fetch element state for all verifications in one round-trip
+            self.take_snapshot([expected['selector'] for expected in test_case.expected_results
+                                if expected['type'] in SNAPSHOT_TYPES and 'selector' in expected])
+            
             # Verify results
             for expected in test_case.expected_results:
                 if not self.verify_result(expected):
-                    result.error_message = f"Verification failed: {expected}"
-                    result.screenshot_path = self.take_screenshot(test_case.name)
+                    result.error_message = f"Verification failed: {self.describe_failure(expected)}"
+                    result.screenshot_path = self.take_screenshot(test_case.name, now)
                     return result
             
             result.status = "PASS"
@@ -296,50 +764,198 @@ class TestExecutor:
             
         except Exception as e:
             result.error_message = str(e)
-            result.screenshot_path = self.take_screenshot(test_case.name)
+            result.screenshot_path = self.take_screenshot(test_case.name, now)
             self.logger.error(f"Test failed: {test_case.name} - {str(e)}")
         
         finally:
             result.execution_time = time.time() - start_time
+            # A crashed browser is replaced before this thread's next test
+            if result.status != "PASS" and self.driver is not None and not self._driver_alive():
+                self._local.driver_dead = True
+            # Only reuse the page for the next test if we are still on it and nothing
+            # (e.g. validation messages shown by a submit) can have changed the DOM
+            untouched = not any(action['action'] in MUTATING_ACTIONS for action in test_case.actions)
+            try:
+                on_page = untouched and loaded_url is not None and self.driver.current_url == loaded_url
+            except Exception:
+                on_page = False
+            self._last_url = test_case.url if on_page else None
         
         return result
     
+    def _record(self, result: TestResult):
+        """Keep a result in the executor's history; resident executors keep none so memory stays flat"""
+        if not self.keep_browsers:
+            with self._lock:
+                self.results.append(result)
+    
+    def run_static_validation(self, pending: List[tuple], results: List[Optional[TestResult]]) -> List[tuple]:
+        """Resolve validation tests from static HTML, returning the ones still needing a browser"""
+        by_url = {}
+        for index, test_case in pending:
+            if test_case.test_type == "validation":
+                by_url.setdefault(test_case.url, []).append((index, test_case))
+        
+        resolved = set()
+        for url, group in by_url.items():
+            static_results = TestCaseGenerator.quick_static_form_check(
+                url, [test_case for _, test_case in group], self.timeout
+            )
+            for (index, _), result in zip(group, static_results):
+                if result is not None:
+                    results[index] = result
+                    self._record(result)
+                    resolved.add(index)
+        
+        self.logger.info(f"Resolved {len(resolved)} validation tests from static HTML")
+        return [(index, test_case) for index, test_case in pending if index not in resolved]
+    
+    @staticmethod
+    def needs_browser(test_case: TestCase) -> bool:
+        """Whether a test interacts with the page or checks anything beyond URL and title"""
+        return not (
+            all(action['action'] == 'wait' and action.get('until', 'document_ready') == 'document_ready'
+                for action in test_case.actions)
+            and all(expected['type'] in HTTP_TYPES for expected in test_case.expected_results)
+        )
+    
+    def execute_http_test(self, session, test_case: TestCase) -> Optional[TestResult]:
+        """Pass a URL/title-only test with a plain HTTP GET; None means re-check it in Selenium"""
+        start_time = time.time()
+        try:
+            response = session.get(test_case.url, allow_redirects=True, timeout=self.timeout)
+        except Exception as e:
+            self.logger.warning(f"HTTP check failed for {test_case.name}, using browser: {str(e)}")
+            return None
+        if not response.ok:
+            # Error or bot-challenge pages may differ from what a browser gets
+            self.logger.warning(f"HTTP check got status {response.status_code} for {test_case.name}, using browser")
+            return None
+        
+        # requests assumes ISO-8859-1 for text/html without a charset; prefer the page's own declaration
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            meta = META_CHARSET_RE.search(response.content[:4096])
+            response.encoding = meta.group(1).decode('ascii') if meta else response.apparent_encoding
+        
+        match = TITLE_RE.search(response.text)
+        title = " ".join(html.unescape(match.group(1)).split()) if match else ""
+        for expected in test_case.expected_results:
+            if expected['type'] == 'url_contains':
+                passed = expected['value'] in response.url
+            else:
+                passed = expected['value'].lower() in title.lower()
+            if not passed:
+                # JavaScript titles and redirects are invisible over HTTP; let the browser decide
+                self.logger.debug(f"HTTP check mismatch for {test_case.name}, using browser: {expected}")
+                return None
+        
+        return TestResult(
+            test_name=test_case.name,
+            status="PASS",
+            execution_time=time.time() - start_time,
+            timestamp=datetime.now().isoformat()
+        )
+    
+    def run_http_checks(self, pending: List[tuple], results: List[Optional[TestResult]]) -> List[tuple]:
+        """Resolve URL/title-only tests over HTTP, returning the ones still needing a browser"""
+        if requests is None:
+            return pending
+        
+        remaining = []
+        with requests.Session() as session:
+            for index, test_case in pending:
+                result = None if self.needs_browser(test_case) else self.execute_http_test(session, test_case)
+                if result is None:
+                    remaining.append((index, test_case))
+                    continue
+                results[index] = result
+                self._record(result)
+        
+        self.logger.info(f"Resolved {len(pending) - len(remaining)} tests over HTTP without a browser")
+        return remaining
+    
     def execute_test_suite(self, test_cases: List[TestCase]) -> List[TestResult]:
-        """Execute a complete test suite"""
-        self.setup_driver()
-        results = []
+        """Execute a complete test suite across a pool of WebDriver instances"""
+        results = [None] * len(test_cases)
+        pending = list(enumerate(test_cases))
+        with self._lock:
+            self._generation += 1
+        
+        if self.static_validation:
+            pending = self.run_static_validation(pending, results)
+        if self.http_checks:
+            pending = self.run_http_checks(pending, results)
+        if not pending:
+            if _log_buffer:
+                _log_buffer.flush()
+            return results
+        
+        # Each worker thread owns its own browser, started lazily by execute_test so a
+        # failed launch is reported as that test's failure instead of breaking the pool
+        if self.keep_browsers:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+                pool = self._pool
+        else:
+            pool = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(pending))))
         
         try:
-            for test_case in test_cases:
-                result = self.execute_test(test_case)
-                results.append(result)
-                self.results.append(result)
-                
-                # Add small delay between tests
-                time.sleep(1)
+            futures = {pool.submit(self.execute_test, test_case): index
+                       for index, test_case in pending}
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                self._record(result)
                 
         finally:
-            if self.driver:
-                self.driver.quit()
+            if not self.keep_browsers:
+                pool.shutdown()
+                self.quit_drivers()
+            self.wait_for_screenshots(results)
+            if _log_buffer:
+                _log_buffer.flush()
         
         return results
+    
+    def close(self):
+        """Shut down the worker pool and browsers kept alive between suites"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool:
+            pool.shutdown()
+        self.quit_drivers()
+        self._screenshot_pool.shutdown()
 
 class ReportGenerator:
     """Generates detailed test reports"""
     
+    @staticmethod
+    def _tally(results: List[TestResult]):
+        """Count passed/failed tests and total execution time in one pass"""
+        passed = failed = 0
+        total_time = 0.0
+        for r in results:
+            total_time += r.execution_time
+            if r.status == "PASS":
+                passed += 1
+            elif r.status == "FAIL":
+                failed += 1
+        return passed, failed, total_time
+    
     @staticmethod
     def generate_html_report(results: List[TestResult], output_file: str = "test_report.html"):
         """Generate comprehensive HTML report"""
         
         total_tests = len(results)
-        passed_tests = len([r for r in results if r.status == "PASS"])
-        failed_tests = len([r for r in results if r.status == "FAIL"])
+        passed_tests, failed_tests, _ = ReportGenerator._tally(results)
         pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         
-        html_content = f"""
+        header = f"""
         <!DOCTYPE html>
         <html>
         <head>
+            <meta charset="utf-8">
             <title>Test Execution Report</title>
             <style>
                 body {{ font-family: Arial, sans-serif; margin: 20px; }}
@@ -393,36 +1009,36 @@ class ReportGenerator:
                 <tbody>
         """
         
-        for result in results:
-            status_class = f"status-{result.status.lower()}"
-            html_content += f"""
-                    <tr class="{status_class}">
-                        <td>{result.test_name}</td>
-                        <td>{result.status}</td>
-                        <td>{result.execution_time:.2f}</td>
-                        <td>{result.error_message}</td>
-                        <td>{result.timestamp}</td>
-                    </tr>
-            """
-        
-        html_content += """
+        footer = """
                 </tbody>
             </table>
         </body>
         </html>
         """
         
-        with open(output_file, 'w') as f:
-            f.write(html_content)
+        # Stream rows straight to the file rather than building the whole document
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(header)
+            for result in results:
+                f.write(ROW_TEMPLATE.format(
+                    c=html.escape(result.status.lower()),
+                    n=html.escape(result.test_name),
+                    s=html.escape(result.status),
+                    t=result.execution_time,
+                    e=html.escape(result.error_message),
+                    ts=html.escape(result.timestamp)
+                ))
+            f.write(footer)
         
         return output_file
     
     @staticmethod
     def generate_csv_report(results: List[TestResult], output_file: str = "test_results.csv"):
         """Generate CSV report for further analysis"""
-        data = [asdict(result) for result in results]
-        df = pd.DataFrame(data)
-        df.to_csv(output_file, index=False)
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(TestResult)])
+            writer.writeheader()
+            writer.writerows(asdict(result) for result in results)
         return output_file
     
     @staticmethod
@@ -431,38 +1047,23 @@ class ReportGenerator:
         if not results:
             return {}
         
-        total_time = sum(r.execution_time for r in results)
-        avg_time = total_time / len(results)
+        n = len(results)
+        passed, failed, total_time = ReportGenerator._tally(results)
         
         stats = {
-            "total_tests": len(results),
-            "passed_tests": len([r for r in results if r.status == "PASS"]),
-            "failed_tests": len([r for r in results if r.status == "FAIL"]),
+            "total_tests": n,
+            "passed_tests": passed,
+            "failed_tests": failed,
             "total_execution_time": total_time,
-            "average_execution_time": avg_time,
-            "pass_rate": len([r for r in results if r.status == "PASS"]) / len(results) * 100
+            "average_execution_time": total_time / n,
+            "pass_rate": passed / n * 100
         }
         
         return stats
 
 # Example usage and configuration
-def main():
-    """Main function demonstrating the test suite generator"""
-
-    parser = argparse.ArgumentParser(description="Automated Test Suite Generator")
-    parser.add_argument('--test-type', type=str, default='all', choices=['all', 'form', 'regression', 'performance', 'unit'], help='Type of test to run')
-    args = parser.parse_args()
-
-    # Read the URL from webtest_url.txt
-    url_file = "webtest_url.txt"
-    if not os.path.exists(url_file):
-        print(f"URL file '{url_file}' not found.")
-        return
-    with open(url_file, "r") as f:
-        user_url = f.read().strip()
-    if not user_url:
-        print("No URL provided in webtest_url.txt.")
-        return
+def generate_test_suite(user_url: str, test_type: str = 'all') -> List[TestCase]:
+    """Generate the test cases of the given type for a user-provided URL"""
 
     # Use user-provided URL in form and regression test configs
     form_config = {
@@ -496,21 +1097,25 @@ def main():
     # Generate test cases
     generator = TestCaseGenerator()
     all_tests = []
-    if args.test_type in ['all', 'form']:
+    if test_type in ['all', 'form']:
         all_tests += generator.generate_form_validation_tests(form_config)
-    if args.test_type in ['all', 'regression']:
+    if test_type in ['all', 'regression']:
         all_tests += generator.generate_regression_tests(pages_config)
-    if args.test_type in ['all', 'performance']:
+    if test_type in ['all', 'performance']:
         # Placeholder: implement performance test generation if needed
         pass
-    if args.test_type in ['all', 'unit']:
+    if test_type in ['all', 'unit']:
         # Placeholder: implement unit test generation if needed
         pass
 
-    print(f"Generated {len(all_tests)} test cases for {user_url} [{args.test_type}]")
+    return all_tests
+
+def run_test_suite(executor: TestExecutor, user_url: str, test_type: str = 'all'):
+    """Generate, execute and report on a test suite; returns (html_report, csv_report, stats)"""
+    all_tests = generate_test_suite(user_url, test_type)
+    print(f"Generated {len(all_tests)} test cases for {user_url} [{test_type}]")
 
     # Execute tests
-    executor = TestExecutor(headless=True)
     results = executor.execute_test_suite(all_tests)
 
     # Generate reports
@@ -518,6 +1123,33 @@ def main():
     html_report = report_gen.generate_html_report(results)
     csv_report = report_gen.generate_csv_report(results)
     stats = report_gen.generate_summary_stats(results)
+    return html_report, csv_report, stats
+
+def main():
+    """Main function demonstrating the test suite generator"""
+
+    parser = argparse.ArgumentParser(description="Automated Test Suite Generator")
+    parser.add_argument('--test-type', type=str, default='all', choices=['all', 'form', 'regression', 'performance', 'unit'], help='Type of test to run')
+    parser.add_argument('--static-validation', action='store_true', help='Check validation tests against static HTML before launching a browser')
+    parser.add_argument('--no-http-checks', action='store_true', help='Run URL/title-only tests in the browser instead of over plain HTTP')
+    parser.add_argument('--full-render', action='store_true', help='Load images and wait for the full page load event')
+    parser.add_argument('--workers', type=int, default=None, help='Number of parallel browser instances (defaults to CPU count)')
+    args = parser.parse_args()
+
+    # Read the URL from webtest_url.txt
+    url_file = "webtest_url.txt"
+    if not os.path.exists(url_file):
+        print(f"URL file '{url_file}' not found.")
+        return
+    with open(url_file, "r") as f:
+        user_url = f.read().strip()
+    if not user_url:
+        print("No URL provided in webtest_url.txt.")
+        return
+
+    executor = TestExecutor(headless=True, max_workers=args.workers, static_validation=args.static_validation,
+                            http_checks=not args.no_http_checks, fast_mode=not args.full_render)
+    html_report, csv_report, stats = run_test_suite(executor, user_url, args.test_type)
 
     print(f"Test execution completed!")
     print(f"HTML Report: {html_report}")
@@ -1,10 +1,15 @@
 from flask import Flask, render_template_string, request, redirect, url_for, send_from_directory
-import subprocess
+import atexit
 import os
 import time
+from test import TestExecutor, run_test_suite
 
 app = Flask(__name__)
 
+# Browsers stay resident between requests instead of relaunching per run
+executor = TestExecutor(headless=True, keep_browsers=True)
+atexit.register(executor.close)
+
 HTML_FORM = """
 <!DOCTYPE html>
 <html>
@@ -46,8 +51,7 @@ def index():
         test_type = request.form.get("test_type", "all")
         with open("webtest_url.txt", "w") as f:
             f.write(url)
-        python_exe = os.path.join(os.getcwd(), "myenv", "Scripts", "python.exe")
-        subprocess.run([python_exe, "test.py", "--test-type", test_type])
+        run_test_suite(executor, url, test_type)
         if os.path.exists("test_report.html"):
             # Add a timestamp to the report link to prevent caching
             report_link = url_for('report') + f'?t={int(time.time())}'